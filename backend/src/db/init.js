@@ -229,6 +229,7 @@ async function runMigrations(client) {
     'add_ai_task_checkpoints.sql',
     'add_review_queue.sql',
     'add_background_agent_indexes.sql',
+    'add_background_task_leases.sql',
     'add_document_learning.sql',
     'add_document_ai_insights.sql',
     'add_harness_intelligence.sql',
@@ -8,6 +8,14 @@ CREATE INDEX IF NOT EXISTS idx_ai_background_tasks_status ON ai_background_tasks
 CREATE INDEX IF NOT EXISTS idx_ai_background_tasks_user_status ON ai_background_tasks(user_id, status);
 CREATE INDEX IF NOT EXISTS idx_ai_background_tasks_user_started ON ai_background_tasks(user_id, started_at DESC);
 
+-- Partial indexes over live tasks only (running/pending rows are a tiny slice of the table)
+-- Active task lookup: WHERE user_id = $1 AND status IN (...) ORDER BY updated_at DESC LIMIT 1
+CREATE INDEX IF NOT EXISTS idx_ai_background_tasks_user_live ON ai_background_tasks(user_id, updated_at DESC)
+  WHERE status IN ('running', 'pending');
+-- Resume scan at startup: WHERE status IN (...) AND checkpoint IS NOT NULL ORDER BY started_at DESC
+CREATE INDEX IF NOT EXISTS idx_ai_background_tasks_resumable ON ai_background_tasks(started_at DESC)
+  WHERE status IN ('running', 'pending') AND checkpoint IS NOT NULL;
+
 -- AI Learning Patterns indexes for hierarchical learning queries
 CREATE INDEX IF NOT EXISTS idx_ai_learning_patterns_firm_id ON ai_learning_patterns(firm_id);
 CREATE INDEX IF NOT EXISTS idx_ai_learning_patterns_user_id ON ai_learning_patterns(user_id);
@@ -0,0 +1,13 @@
+-- Background Task Leases
+-- A task is owned by the instance that claimed it (claimed_by) until its lease
+-- lapses. The owner renews the lease while the task runs, so other instances
+-- only resume a task once its owner has stopped or released it.
+
+ALTER TABLE ai_background_tasks ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(255);
+ALTER TABLE ai_background_tasks ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMPTZ;
+
+-- Lease renewal: WHERE claimed_by = $1 AND status IN (...)
+CREATE INDEX IF NOT EXISTS idx_ai_background_tasks_claimed_by ON ai_background_tasks(claimed_by)
+  WHERE status IN ('running', 'pending');
+
+SELECT 'Background task lease migration completed!' as status;
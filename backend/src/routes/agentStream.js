@@ -94,25 +94,32 @@ async function authenticateSSE(req, res, next) {
 // In-memory storage for active streams and events
 // In production, use Redis for multi-instance support
 const activeStreams = new Map(); // taskId -> Set of response objects
-const eventHistory = new Map();  // taskId -> Array of events
+const eventHistory = new Map();  // taskId -> EventRing of recent events
 const progressState = new Map(); // taskId -> current progress
 const taskMetadata = new Map();  // taskId -> { startTime, lastEventTime, status }
+let heartbeatTimer = null;       // Shared heartbeat interval, only set while streams are open
 
 const MAX_HISTORY = 500;
 const HEARTBEAT_INTERVAL = 15000; // 15 seconds for more responsive connections
+const MAX_PENDING_BYTES = 1024 * 1024; // Drop clients that stop reading after 1MB is queued
 const STALE_HISTORY_MS = 3600000; // Clean up history after 1 hour
+const ORPHANED_HISTORY_MS = 6 * 3600000; // Clean up tasks that never reported a final status
 
 // Periodic cleanup of stale event history to prevent memory leaks
 setInterval(() => {
   const now = Date.now();
   for (const [taskId, metadata] of taskMetadata.entries()) {
-    if (metadata.status === 'completed' || metadata.status === 'failed') {
-      if (now - metadata.lastEventTime > STALE_HISTORY_MS) {
-        eventHistory.delete(taskId);
-        progressState.delete(taskId);
-        taskMetadata.delete(taskId);
-        console.log(`[AgentStream] Cleaned up stale history for task ${taskId}`);
-      }
+    const idleMs = now - (metadata.lastEventTime || 0);
+    const isFinished = metadata.status === 'completed' || metadata.status === 'failed';
+    // A task that crashed or was killed never sends a final status, so
+    // its history is dropped once it has been silent with nobody watching
+    const isOrphaned = !activeStreams.has(taskId) && idleMs > ORPHANED_HISTORY_MS;
+    
+    if ((isFinished && idleMs > STALE_HISTORY_MS) || isOrphaned) {
+      eventHistory.delete(taskId);
+      progressState.delete(taskId);
+      taskMetadata.delete(taskId);
+      console.log(`[AgentStream] Cleaned up ${isFinished ? 'stale' : 'orphaned'} history for task ${taskId}`);
     }
   }
 }, 300000); // Run every 5 minutes
@@ -167,53 +174,33 @@ router.get('/:taskId', authenticateSSE, (req, res) => {
   }
   
   // Send recent history for reconnection - more events if reconnecting
-  const history = eventHistory.get(taskId) || [];
+  const history = eventHistory.get(taskId);
   const historyLimit = reconnectId ? 100 : 50;
-  if (history.length > 0) {
+  if (history && history.length > 0) {
     sendSSE(res, 'history', { 
-      events: history.slice(-historyLimit),
+      events: history.tail(historyLimit),
       totalEvents: history.length,
       isReconnection: !!reconnectId
     });
   }
   
-  // Heartbeat to keep connection alive with progress check
-  const heartbeat = setInterval(() => {
-    if (!res.writableEnded) {
-      try {
-        const currentProgress = progressState.get(taskId);
-        sendSSE(res, 'heartbeat', { 
-          timestamp: new Date().toISOString(),
-          serverTime: Date.now(),
-          hasProgress: !!currentProgress,
-          status: currentProgress?.status || 'unknown'
-        });
-      } catch (e) {
-        console.error(`[AgentStream] Heartbeat error for ${taskId}:`, e.message);
-        clearInterval(heartbeat);
-      }
-    } else {
-      clearInterval(heartbeat);
-    }
-  }, HEARTBEAT_INTERVAL);
+  // Heartbeats are sent by the shared timer while any stream is open
+  ensureHeartbeat();
   
   // Handle errors
   res.on('error', (err) => {
     console.error(`[AgentStream] Response error for task ${taskId}:`, err.message);
-    clearInterval(heartbeat);
     cleanupConnection(taskId, res);
   });
   
   // Handle client disconnect
   req.on('close', () => {
     console.log(`[AgentStream] Client disconnected from task ${taskId}`);
-    clearInterval(heartbeat);
     cleanupConnection(taskId, res);
   });
   
   req.on('error', (err) => {
     console.error(`[AgentStream] Request error for task ${taskId}:`, err.message);
-    clearInterval(heartbeat);
     cleanupConnection(taskId, res);
   });
 });
@@ -229,6 +216,46 @@ function cleanupConnection(taskId, res) {
       activeStreams.delete(taskId);
     }
   }
+  stopHeartbeatIfIdle();
+}
+
+/**
+ * Start the shared heartbeat timer if it is not already running
+ * One timer serves every open stream instead of one interval per client
+ */
+function ensureHeartbeat() {
+  if (heartbeatTimer) return;
+  heartbeatTimer = setInterval(sendHeartbeats, HEARTBEAT_INTERVAL);
+}
+
+/**
+ * Stop the shared heartbeat timer once no streams are open
+ */
+function stopHeartbeatIfIdle() {
+  if (heartbeatTimer && activeStreams.size === 0) {
+    clearInterval(heartbeatTimer);
+    heartbeatTimer = null;
+  }
+}
+
+/**
+ * Send a heartbeat with progress status to every open stream
+ */
+function sendHeartbeats() {
+  const serverTime = Date.now();
+  const timestamp = new Date(serverTime).toISOString();
+  
+  for (const taskId of activeStreams.keys()) {
+    const currentProgress = progressState.get(taskId);
+    broadcastEvent(taskId, 'heartbeat', {
+      timestamp,
+      serverTime,
+      hasProgress: !!currentProgress,
+      status: currentProgress?.status || 'unknown'
+    });
+  }
+  
+  stopHeartbeatIfIdle();
 }
 
 /**
@@ -244,29 +271,33 @@ router.post('/:taskId/events', (req, res) => {
   }
   
   // Store events in history
-  if (!eventHistory.has(taskId)) {
-    eventHistory.set(taskId, []);
-  }
-  const history = eventHistory.get(taskId);
+  const history = getHistory(taskId);
   
   for (const event of events) {
     history.push(event);
-    
-    // Broadcast to connected clients
-    broadcastEvent(taskId, 'event', event);
-  }
-  
-  // Trim history
-  if (history.length > MAX_HISTORY) {
-    eventHistory.set(taskId, history.slice(-MAX_HISTORY));
   }
   
   // Update progress state
   if (progress) {
     progressState.set(taskId, progress);
-    broadcastEvent(taskId, 'progress', progress);
   }
   
+  // Broadcast the whole batch as one write per connected client
+  if (activeStreams.get(taskId)?.size) {
+    try {
+      let frames = events.map(event => formatSSE('event', event)).join('');
+      if (progress) {
+        frames += formatSSE('progress', progress);
+      }
+      broadcastFrame(taskId, frames);
+    } catch (e) {
+      console.error('[AgentStream] Error serializing SSE:', e.message);
+    }
+  }
+  
+  // Track activity so the cleanup sweep can release this task's history
+  touchTaskMetadata(taskId, Date.now(), progress?.status);
+  
   res.json({ 
     success: true, 
     received: events.length,
@@ -282,14 +313,14 @@ router.get('/:taskId/history', authenticate, (req, res) => {
   const { taskId } = req.params;
   const limit = parseInt(req.query.limit) || 100;
   
-  const history = eventHistory.get(taskId) || [];
+  const history = eventHistory.get(taskId);
   const progress = progressState.get(taskId);
   
   res.json({
     taskId,
-    events: history.slice(-limit),
+    events: history ? history.tail(limit) : [],
     progress,
-    total: history.length
+    total: history ? history.length : 0
   });
 });
 
@@ -330,15 +361,101 @@ router.get('/debug/active', authenticate, (req, res) => {
 // ============================================================================
 
 /**
- * Send an SSE event to a client with error handling
+ * Fixed-capacity ring buffer for a task's event history
+ * Once full, each push overwrites the oldest event in place instead of
+ * re-slicing the whole array
  */
-function sendSSE(res, eventType, data) {
+class EventRing {
+  constructor(capacity) {
+    this.capacity = capacity;
+    this.items = [];
+    this.start = 0;
+  }
+  
+  get length() {
+    return this.items.length;
+  }
+  
+  push(event) {
+    if (this.items.length < this.capacity) {
+      this.items.push(event);
+      return;
+    }
+    this.items[this.start] = event;
+    this.start = (this.start + 1) % this.capacity;
+  }
+  
+  /**
+   * Return the most recent events, oldest first
+   */
+  tail(count) {
+    const size = this.items.length;
+    const n = count > 0 ? Math.min(count, size) : size;
+    const events = new Array(n);
+    for (let i = 0; i < n; i++) {
+      events[i] = this.items[(this.start + size - n + i) % size];
+    }
+    return events;
+  }
+}
+
+/**
+ * Get (or create) the event history for a task
+ */
+function getHistory(taskId) {
+  let history = eventHistory.get(taskId);
+  if (!history) {
+    history = new EventRing(MAX_HISTORY);
+    eventHistory.set(taskId, history);
+  }
+  return history;
+}
+
+/**
+ * Record activity for a task
+ * The metadata object is created once per task and updated in place, so
+ * every event no longer allocates and copies a fresh object
+ */
+function touchTaskMetadata(taskId, now, status) {
+  let metadata = taskMetadata.get(taskId);
+  if (!metadata) {
+    metadata = { startTime: now, lastEventTime: now, status: undefined };
+    taskMetadata.set(taskId, metadata);
+  }
+  metadata.lastEventTime = now;
+  if (status !== undefined) {
+    metadata.status = status;
+  }
+  return metadata;
+}
+
+/**
+ * Serialize an event into a complete SSE frame
+ */
+function formatSSE(eventType, data) {
+  return `event: ${eventType}\ndata: ${JSON.stringify(data)}\n\n`;
+}
+
+/**
+ * Write a pre-formatted SSE frame to a client with error handling
+ * A client that has stopped draining its socket is disconnected rather than
+ * buffered without bound; it gets the missed events from history on reconnect
+ */
+function writeSSE(res, frame) {
   if (res.writableEnded || res.destroyed) return false;
   
+  if (res.writableLength > MAX_PENDING_BYTES) {
+    // Destroy rather than end(): the end of the response would only queue
+    // behind the unread buffer, keeping the socket and its memory alive
+    // (these streams have no timeout). Destroying frees both and fires
+    // 'close', which runs cleanupConnection
+    console.warn(`[AgentStream] Dropping slow client (${res.writableLength} bytes pending)`);
+    res.destroy();
+    return false;
+  }
+  
   try {
-    const payload = JSON.stringify(data);
-    res.write(`event: ${eventType}\n`);
-    res.write(`data: ${payload}\n\n`);
+    res.write(frame);
     return true;
   } catch (e) {
     console.error('[AgentStream] Error sending SSE:', e.message);
@@ -346,19 +463,53 @@ function sendSSE(res, eventType, data) {
   }
 }
 
+/**
+ * Send an SSE event to a client with error handling
+ */
+function sendSSE(res, eventType, data) {
+  if (res.writableEnded || res.destroyed) return false;
+  
+  try {
+    return writeSSE(res, formatSSE(eventType, data));
+  } catch (e) {
+    console.error('[AgentStream] Error serializing SSE:', e.message);
+    return false;
+  }
+}
+
 /**
  * Broadcast an event to all connected clients for a task
+ * The event is serialized once and the same frame is written to every client
  * Returns the number of successful sends
  */
 function broadcastEvent(taskId, eventType, data) {
   const streams = activeStreams.get(taskId);
   if (!streams || streams.size === 0) return 0;
   
+  let frame;
+  try {
+    frame = formatSSE(eventType, data);
+  } catch (e) {
+    console.error('[AgentStream] Error serializing SSE:', e.message);
+    return 0;
+  }
+  
+  return broadcastFrame(taskId, frame);
+}
+
+/**
+ * Write pre-formatted SSE frames (one or several) to all clients for a task
+ * Returns the number of successful sends
+ */
+function broadcastFrame(taskId, frame) {
+  const streams = activeStreams.get(taskId);
+  if (!streams || streams.size === 0) return 0;
+  
   let successCount = 0;
   const failedStreams = [];
   
   for (const res of streams) {
-    if (sendSSE(res, eventType, data)) {
+    if (writeSSE(res, frame)) {
       successCount++;
     } else {
       failedStreams.push(res);
@@ -384,30 +535,19 @@ function broadcastEvent(taskId, eventType, data) {
 export function pushAgentEvent(taskId, eventType, data) {
   if (!taskId) return;
   
-  const timestamp = new Date().toISOString();
+  // Read the clock once and reuse it for both the event and the metadata
+  const now = Date.now();
   const eventData = {
     type: eventType,
     ...data,
-    timestamp
+    timestamp: new Date(now).toISOString()
   };
   
   // Store in history
-  if (!eventHistory.has(taskId)) {
-    eventHistory.set(taskId, []);
-  }
-  const history = eventHistory.get(taskId);
-  history.push(eventData);
-  
-  // Trim history if too large
-  if (history.length > MAX_HISTORY) {
-    eventHistory.set(taskId, history.slice(-MAX_HISTORY));
-  }
+  getHistory(taskId).push(eventData);
   
   // Update metadata
-  taskMetadata.set(taskId, {
-    ...taskMetadata.get(taskId),
-    lastEventTime: Date.now()
-  });
+  touchTaskMetadata(taskId, now);
   
   // Broadcast
   broadcastEvent(taskId, 'event', eventData);
@@ -428,11 +568,7 @@ export function updateAgentProgress(taskId, progress) {
   progressState.set(taskId, progressWithTimestamp);
   
   // Update metadata with status
-  taskMetadata.set(taskId, {
-    ...taskMetadata.get(taskId),
-    lastEventTime: Date.now(),
-    status: progress.status
-  });
+  touchTaskMetadata(taskId, Date.now(), progress.status);
   
   broadcastEvent(taskId, 'progress', progressWithTimestamp);
 }
@@ -443,11 +579,7 @@ export function updateAgentProgress(taskId, progress) {
 export function markTaskComplete(taskId, status = 'completed') {
   if (!taskId) return;
   
-  taskMetadata.set(taskId, {
-    ...taskMetadata.get(taskId),
-    lastEventTime: Date.now(),
-    status
-  });
+  touchTaskMetadata(taskId, Date.now(), status);
   
   // Broadcast completion event
   broadcastEvent(taskId, 'task_complete', {
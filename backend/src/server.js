@@ -253,7 +253,6 @@ app.listen(PORT, () => {
       const configured = await amplifierService.configure();
       if (configured) {
         console.log('✓ Amplifier background agent initialized');
-        await amplifierService.resumePendingTasks();
       } else {
         console.log('⚠ Amplifier background agent not available');
       }
@@ -431,6 +431,23 @@ const GENERAL_WORK = {
   }
 };
 
+/**
+ * Triggers are compiled once here rather than on every classifyWork call.
+ * A trigger that is not a valid regex falls back to a plain substring match.
+ */
+function compileTrigger(trigger) {
+  try {
+    return new RegExp(trigger, 'i');
+  } catch {
+    return trigger;
+  }
+}
+
+const WORK_TYPE_MATCHERS = Object.values(WORK_TYPES).map(workType => ({
+  workType,
+  triggers: workType.triggers.map(compileTrigger),
+}));
+
 
 // ===== MAIN FUNCTIONS =====
 
@@ -444,20 +461,16 @@ export function classifyWork(goal) {
   let bestMatch = null;
   let bestScore = 0;
   
-  for (const [key, workType] of Object.entries(WORK_TYPES)) {
+  for (const { workType, triggers } of WORK_TYPE_MATCHERS) {
     let score = 0;
-    for (const trigger of workType.triggers) {
-      // Support regex-style triggers
-      try {
-        const regex = new RegExp(trigger, 'i');
-        if (regex.test(goalLower)) {
+    for (const trigger of triggers) {
+      if (trigger instanceof RegExp) {
+        if (trigger.test(goalLower)) {
           score += 2; // Regex match is worth more
         }
-      } catch {
+      } else if (goalLower.includes(trigger)) {
         // Plain string match
-        if (goalLower.includes(trigger)) {
-          score += 1;
-        }
+        score += 1;
       }
     }
     
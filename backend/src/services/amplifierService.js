@@ -13,6 +13,8 @@
  */
 
 import { EventEmitter } from 'events';
+import crypto from 'crypto';
+import os from 'os';
 import { query } from '../db/connection.js';
 import { getUserContext, getMatterContext, getLearningContext } from './amplifier/platformContext.js';
 import { getLawyerProfile, formatProfileForPrompt as formatLawyerProfile, updateProfileAfterTask } from './amplifier/lawyerProfile.js';
@@ -136,6 +138,8 @@ const DEFAULT_MAX_RUNTIME_MINUTES = 90;   // Up from 45: 60 min target + 30 min
 const EXTENDED_MAX_ITERATIONS = 800;      // Up from 400: deep-dive complex projects
 const EXTENDED_MAX_RUNTIME_MINUTES = 480; // Up from 120: 8 hours for major projects
 const CHECKPOINT_INTERVAL_MS = 10000;     // Down from 15s: save progress more often
+const TASK_LEASE_MS = 2 * 60 * 1000;      // A claimed task belongs to one instance until its lease lapses
+const TASK_LEASE_RENEW_MS = 30 * 1000;    // Owners renew well inside the lease window
 const MESSAGE_COMPACT_MAX_CHARS = 40000;
 const MESSAGE_COMPACT_MAX_MESSAGES = 50;
 const MEMORY_MESSAGE_PREFIX = '## TASK MEMORY';
@@ -342,6 +346,35 @@ function markPersistenceUnavailable(error) {
   }
 }
 
+// Identifies this process as the owner of the tasks it claims
+const INSTANCE_ID = `${os.hostname()}-${process.pid}-${crypto.randomBytes(4).toString('hex')}`;
+
+/**
+ * Atomically claim stored tasks before resuming them
+ * A task is only claimable when it has no owner or its owner's lease has
+ * lapsed - including when the owner is this instance, so two concurrent
+ * resume paths in one process cannot both claim it either. The claim records
+ * this instance as owner and starts a lease that the owner keeps renewing
+ * while it runs the task, so a running task can never be claimed a second
+ * time, however late the claimer read it.
+ * All tasks are claimed in a single statement; returns the Set of claimed IDs.
+ */
+async function claimStoredTasks(taskIds) {
+  if (taskIds.length === 0) return new Set();
+  const result = await query(
+    `UPDATE ai_background_tasks
+     SET claimed_by = $2,
+         lease_expires_at = NOW() + make_interval(secs => $3),
+         updated_at = NOW()
+     WHERE id = ANY($1::text[])
+       AND status IN ('running', 'pending')
+       AND (claimed_by IS NULL OR lease_expires_at < NOW())
+     RETURNING id`,
+    [taskIds, INSTANCE_ID, TASK_LEASE_MS / 1000]
+  );
+  return new Set(result.rows.map(row => row.id));
+}
+
 /**
  * Get Azure OpenAI configuration - uses constants read at module load
  */
@@ -355,9 +388,14 @@ function getAzureConfig() {
 
 /**
  * Generate a unique task ID
+ * The per-process sequence rules out clashes between tasks started in the same
+ * millisecond here; the random bytes keep IDs distinct across instances
  */
+let taskIdSequence = 0;
+
 function generateTaskId() {
-  return `amp-${Date.now()}-${Math.random().toString(36).substr(2, 9)}`;
+  const sequence = (taskIdSequence++).toString(36);
+  return `amp-${Date.now()}-${sequence}${crypto.randomBytes(5).toString('hex')}`;
 }
 
 /**
@@ -552,6 +590,8 @@ class BackgroundTask extends EventEmitter {
     this.maxRuntimeMs = (options.maxRuntimeMinutes || options.max_runtime_minutes || baseRuntimeMinutes) * 60 * 1000;
     this.isExtendedMode = isExtended;
     this.lastCheckpointAt = 0;
+    this.lastCheckpointDigest = null;
+    this.checkpointWrite = null;
     this.plan = null;
     this.recentTools = [];
     
@@ -651,21 +691,7 @@ class BackgroundTask extends EventEmitter {
     // interventions when the agent drifts, and provides budget awareness signals.
     this.focusGuard = createFocusGuard(goal, this.maxIterations, this.maxRuntimeMs);
     
-    // Tools that are safe to cache (read-only, no side effects)
-    this.CACHEABLE_TOOLS = new Set([
-      'get_matter', 'list_my_matters', 'search_matters', 'list_clients', 'get_client',
-      'list_documents', 'read_document_content', 'search_document_content',
-      'get_calendar_events', 'list_tasks', 'list_invoices', 'get_firm_analytics',
-      'list_team_members', 'get_upcoming_deadlines', 'lookup_cplr',
-      'find_and_read_document', 'get_document', 'get_document_versions',
-      'get_matter_documents_content',
-    ]);
-    
-    // Longer TTL for tools that return stable data (matter details don't change mid-task)
-    this.STABLE_CACHE_TOOLS = new Set([
-      'get_matter', 'get_client', 'lookup_cplr', 'list_team_members',
-      'get_firm_analytics', 'list_my_matters', 'search_matters',
-    ]);
+    // Longer TTL for tools that return stable data (see BackgroundTask.STABLE_CACHE_TOOLS)
     this.STABLE_CACHE_TTL_MS = 15 * 60 * 1000; // 15 minutes for stable data
     
     // ===== DECISION REINFORCER (real-time learning per tool outcome) =====
@@ -701,9 +727,9 @@ class BackgroundTask extends EventEmitter {
    */
   streamEvent(eventType, message, data = {}) {
     try {
+      // pushAgentEvent stamps the event itself, so no timestamp is built here
       pushAgentEvent(this.id, eventType, {
         message,
-        timestamp: new Date().toISOString(),
         ...data
       });
     } catch (e) {
@@ -1117,6 +1143,25 @@ If any deliverable is weak, fix it now with another tool call. Then proceed to R
 
   // ===== TOOL RESULT CACHING =====
   
+  // Tools that are safe to cache (read-only, no side effects)
+  static CACHEABLE_TOOLS = new Set([
+    'get_matter', 'list_my_matters', 'search_matters', 'list_clients', 'get_client',
+    'list_documents', 'read_document_content', 'search_document_content',
+    'get_calendar_events', 'list_tasks', 'list_invoices', 'get_firm_analytics',
+    'list_team_members', 'get_upcoming_deadlines', 'lookup_cplr',
+    'find_and_read_document', 'get_document', 'get_document_versions',
+    'get_matter_documents_content',
+  ]);
+  
+  // Longer TTL for tools that return stable data (matter details don't change mid-task)
+  static STABLE_CACHE_TOOLS = new Set([
+    'get_matter', 'get_client', 'lookup_cplr', 'list_team_members',
+    'get_firm_analytics', 'list_my_matters', 'search_matters',
+  ]);
+  
+  // Meta tools that don't count as completed work steps
+  static META_TOOLS = new Set(['think_and_plan', 'evaluate_progress', 'task_complete', 'log_work']);
+  
   /**
    * Get a cache key for a tool call
    */
@@ -1130,14 +1175,14 @@ If any deliverable is weak, fix it now with another tool call. Then proceed to R
    * Check if a cached result exists and is still valid
    */
   getCachedResult(toolName, args) {
-    if (!this.CACHEABLE_TOOLS.has(toolName)) return null;
+    if (!BackgroundTask.CACHEABLE_TOOLS.has(toolName)) return null;
     
     const key = this.getToolCacheKey(toolName, args);
     const cached = this.toolCache.get(key);
     if (!cached) return null;
     
     // Use longer TTL for stable data tools (matter details don't change mid-task)
-    const ttl = this.STABLE_CACHE_TOOLS.has(toolName) ? this.STABLE_CACHE_TTL_MS : this.CACHE_TTL_MS;
+    const ttl = BackgroundTask.STABLE_CACHE_TOOLS.has(toolName) ? this.STABLE_CACHE_TTL_MS : this.CACHE_TTL_MS;
     if (Date.now() - cached.timestamp > ttl) {
       this.toolCache.delete(key);
       return null;
@@ -1151,7 +1196,7 @@ If any deliverable is weak, fix it now with another tool call. Then proceed to R
    * Store a tool result in the cache
    */
   cacheToolResult(toolName, args, result) {
-    if (!this.CACHEABLE_TOOLS.has(toolName)) return;
+    if (!BackgroundTask.CACHEABLE_TOOLS.has(toolName)) return;
     if (result?.error) return; // Don't cache errors
     
     const key = this.getToolCacheKey(toolName, args);
@@ -2509,7 +2554,7 @@ ${candidateList}
     this.compactMessagesIfNeeded();
 
     return {
-      messages: JSON.parse(JSON.stringify(this.normalizeMessages(this.messages))),
+      messages: this.normalizeMessages(this.messages),
       actionsHistory: this.actionsHistory.slice(-200),
       progress: this.progress,
       result: this.result,
@@ -2521,7 +2566,6 @@ ${candidateList}
       phaseIterationCounts: this.phaseIterationCounts,
       substantiveActions: this.substantiveActions,
       systemPrompt: this.systemPrompt,
-      lastCheckpointAt: new Date().toISOString(),
       // Persist rewind system state (failed paths, rewind history)
       rewindState: this.rewindManager ? this.rewindManager.getSerializableState() : null,
       // Persist recursive summarization memory
@@ -2540,16 +2584,37 @@ ${candidateList}
     if (now - this.lastCheckpointAt < CHECKPOINT_INTERVAL_MS && reason === 'periodic') {
       return;
     }
+    // Only one row write per task at a time: a periodic save that lands while
+    // another is still in flight is dropped (the next one picks up its state),
+    // and any other save queues behind it
+    if (this.checkpointWrite && reason === 'periodic') return;
+    // Waited on inline, so that once the loop sees no write in flight this
+    // save registers its own before any other waiter can resume
+    while (this.checkpointWrite) {
+      await this.checkpointWrite;
+    }
     this.lastCheckpointAt = now;
 
-    const checkpoint = this.buildCheckpointPayload();
+    // Serialize once, right here: this both snapshots the live task state and
+    // is the exact JSON sent for the checkpoint column
+    const state = JSON.stringify(this.buildCheckpointPayload());
+
+    // Periodic saves fire after every iteration; when nothing changed since the
+    // last write there is no point rewriting the whole checkpoint row. Only a
+    // digest of the last written state is kept, not a second copy of it
+    const stateDigest = crypto.createHash('sha1').update(state).digest('base64');
+    if (reason === 'periodic' && stateDigest === this.lastCheckpointDigest) {
+      return;
+    }
+    const checkpoint = `${state.slice(0, -1)},"lastCheckpointAt":${JSON.stringify(new Date().toISOString())}}`;
 
     try {
-      await query(
+      const write = this.trackRowWrite(query(
         `INSERT INTO ai_background_tasks (
           id, firm_id, user_id, goal, status, progress, result, error, started_at, iterations,
-          max_iterations, options, checkpoint, checkpoint_at, updated_at
-        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, NOW(), NOW())
+          max_iterations, options, checkpoint, checkpoint_at, updated_at, claimed_by, lease_expires_at
+        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, NOW(), NOW(), $14,
+                  NOW() + make_interval(secs => $15))
         ON CONFLICT (id) DO UPDATE SET
           status = EXCLUDED.status,
           progress = EXCLUDED.progress,
@@ -2560,7 +2625,12 @@ ${candidateList}
           options = EXCLUDED.options,
           checkpoint = EXCLUDED.checkpoint,
           checkpoint_at = NOW(),
-          updated_at = NOW()`,
+          updated_at = NOW(),
+          claimed_by = EXCLUDED.claimed_by,
+          lease_expires_at = EXCLUDED.lease_expires_at
+        WHERE ai_background_tasks.claimed_by IS NULL
+           OR ai_background_tasks.claimed_by = EXCLUDED.claimed_by
+           OR ai_background_tasks.lease_expires_at < NOW()`,
         [
           this.id,
           this.firmId,
@@ -2574,9 +2644,24 @@ ${candidateList}
           this.progress.iterations,
           this.maxIterations,
           this.options || {},
-          checkpoint
+          checkpoint,
+          INSTANCE_ID,
+          TASK_LEASE_MS / 1000
         ]
-      );
+      ));
+      const result = await write;
+      if (result.rowCount === 0) {
+        // Our lease lapsed and another instance has taken the task over;
+        // stop this copy rather than keep writing over the new owner's state
+        console.warn(`[Amplifier] Task ${this.id} is now owned by another instance, stopping this copy`);
+        this.cancelled = true;
+        this.status = TaskStatus.CANCELLED;
+        this.progress.currentStep = 'Continued on another server instance';
+        this.endTime = new Date();
+        this.emit('handedOff', this.getStatus());
+        return;
+      }
+      this.lastCheckpointDigest = stateDigest;
     } catch (error) {
       markPersistenceUnavailable(error);
       if (persistenceAvailable) {
@@ -2585,6 +2670,20 @@ ${candidateList}
     }
   }
 
+  /**
+   * Register a write to this task's row so later writes queue behind it
+   */
+  trackRowWrite(write) {
+    const pending = write.then(() => {}, () => {});
+    this.checkpointWrite = pending;
+    pending.then(() => {
+      if (this.checkpointWrite === pending) {
+        this.checkpointWrite = null;
+      }
+    });
+    return write;
+  }
+
   loadCheckpoint(checkpoint) {
     if (!checkpoint) return;
     this.messages = Array.isArray(checkpoint.messages) ? checkpoint.messages : this.messages;
@@ -2626,27 +2725,36 @@ ${candidateList}
 
   async persistCompletion(status, errorMessage = null) {
     if (!persistenceAvailable) return;
+    // A checkpoint upsert still in flight would write the old status back
+    // over this one if it landed second; queue behind it, and make later
+    // checkpoints queue behind this write in turn
+    while (this.checkpointWrite) {
+      await this.checkpointWrite;
+    }
     try {
       const storedError = status === TaskStatus.FAILED ? (this.error || errorMessage) : null;
       const completedAt = this.endTime || new Date(); // Defensive guard against null endTime
-      await query(
+      await this.trackRowWrite(query(
         `UPDATE ai_background_tasks
          SET status = $1,
              progress = $2,
              result = $3,
              error = $4,
              completed_at = $5,
-             updated_at = NOW()
-         WHERE id = $6`,
+             updated_at = NOW(),
+             claimed_by = NULL,
+             lease_expires_at = NULL
+         WHERE id = $6 AND (claimed_by IS NULL OR claimed_by = $7)`,
         [
           status,
           this.progress,
           this.result,
           storedError,
           completedAt,
-          this.id
+          this.id,
+          INSTANCE_ID
         ]
-      );
+      ));
     } catch (error) {
       markPersistenceUnavailable(error);
       if (persistenceAvailable) {
@@ -3011,8 +3119,8 @@ ${hasMatterPreloaded && matterIsVerified
       this.status = TaskStatus.FAILED;
       this.error = error.message;
       this.endTime = new Date();
+      // console.error formats the Error (including its stack) itself
       console.error(`[Amplifier] Task ${this.id} failed:`, error);
-      console.error(`[Amplifier] Error stack:`, error.stack);
       await this.saveTaskHistory();
       await this.persistCompletion(TaskStatus.FAILED, error.message);
       this.emit('error', error);
@@ -3311,7 +3419,7 @@ ${hasMatterPreloaded && matterIsVerified
           
           // ===== PARALLEL EXECUTION for read-only tools =====
           // If ALL tool calls are cacheable (read-only), execute them in parallel
-          const allReadOnly = parsedCalls.every(c => !c.validationError && this.CACHEABLE_TOOLS.has(c.toolName));
+          const allReadOnly = parsedCalls.every(c => !c.validationError && BackgroundTask.CACHEABLE_TOOLS.has(c.toolName));
           
           if (allReadOnly && parsedCalls.length > 1) {
             console.log(`[Amplifier] Executing ${parsedCalls.length} read-only tools in PARALLEL`);
@@ -3349,7 +3457,7 @@ ${hasMatterPreloaded && matterIsVerified
               this.actionsHistory.push({ tool: tn, args: ta, result: res, timestamp: new Date(), success });
               
               // ===== STEP TRACKING (parallel path) =====
-              if (success && !['think_and_plan', 'evaluate_progress', 'task_complete', 'log_work'].includes(tn)) {
+              if (success && !BackgroundTask.META_TOOLS.has(tn)) {
                 this.progress.completedSteps = (this.progress.completedSteps || 0) + 1;
                 if (this.progress.completedSteps >= this.progress.totalSteps - 2 && this.executionPhase !== 'review') {
                   this.progress.totalSteps = Math.max(this.progress.totalSteps, this.progress.completedSteps + 5);
@@ -3509,7 +3617,7 @@ ${hasMatterPreloaded && matterIsVerified
             // ===== STEP TRACKING: Increment completedSteps on successful tool calls =====
             // Meta tools (think_and_plan, evaluate_progress, task_complete) don't count as steps.
             // Only real work tools count so the step counter reflects actual progress.
-            if (toolSuccess && !['think_and_plan', 'evaluate_progress', 'task_complete', 'log_work'].includes(toolName)) {
+            if (toolSuccess && !BackgroundTask.META_TOOLS.has(toolName)) {
               this.progress.completedSteps = (this.progress.completedSteps || 0) + 1;
               
               // Dynamically adjust totalSteps if we're approaching the estimate
@@ -4931,6 +5039,14 @@ class AmplifierService {
       console.error('[AmplifierService] Error resuming pending tasks:', err.message);
     });
     
+    // Tasks from a crashed or killed process still hold live leases during the
+    // first scan; look again once those leases are guaranteed to have lapsed
+    setTimeout(() => {
+      this.resumePendingTasks().catch(err => {
+        console.error('[AmplifierService] Error resuming pending tasks:', err.message);
+      });
+    }, TASK_LEASE_MS + TASK_LEASE_RENEW_MS).unref();
+    
     return true;
   }
 
@@ -4948,6 +5064,7 @@ class AmplifierService {
         `SELECT id, firm_id, user_id, goal, status, progress, result, error, iterations, max_iterations, options, checkpoint, started_at
          FROM ai_background_tasks
          WHERE status IN ('running', 'pending') AND checkpoint IS NOT NULL
+           AND (lease_expires_at IS NULL OR lease_expires_at < NOW())
          ORDER BY started_at DESC`
       );
 
@@ -4958,9 +5075,23 @@ class AmplifierService {
 
       console.log(`[AmplifierService] Found ${result.rows.length} interrupted task(s) to resume`);
 
-      for (const row of result.rows) {
+      const candidates = result.rows.filter(row => {
         if (this.tasks.has(row.id)) {
           console.log(`[AmplifierService] Task ${row.id} already active, skipping`);
+          return false;
+        }
+        return true;
+      });
+      const claimedIds = await claimStoredTasks(candidates.map(row => row.id));
+      const notifications = [];
+
+      for (const row of candidates) {
+        if (!claimedIds.has(row.id)) {
+          console.log(`[AmplifierService] Task ${row.id} claimed by another worker, skipping`);
+          continue;
+        }
+        if (this.tasks.has(row.id)) {
+          // Loaded by another path while the claim was in flight
           continue;
         }
         
@@ -4988,42 +5119,56 @@ class AmplifierService {
         task.on('complete', () => activeTasks.delete(task.userId));
         task.on('error', () => activeTasks.delete(task.userId));
         task.on('cancelled', () => activeTasks.delete(task.userId));
+        task.on('handedOff', () => this.releaseHandedOffTask(task));
+
+        // Queue a notification for the user that their task is resuming
+        notifications.push({
+          firmId: row.firm_id,
+          userId: row.user_id,
+          message: `Your task "${row.goal.substring(0, 50)}${row.goal.length > 50 ? '...' : ''}" is resuming after a server restart.`,
+          metadata: JSON.stringify({
+            taskId: row.id,
+            resumedAt: new Date().toISOString(),
+            interruptedMinutes,
+            iteration: row.iterations || 0
+          })
+        });
 
-        // Create notification for the user that their task is resuming
+        task.start({ resumeFromCheckpoint: true }).catch(err => {
+          console.error(`[AmplifierService] Resumed task ${row.id} failed:`, err);
+        });
+        
+        console.log(`[AmplifierService] Task ${row.id} resumed successfully`);
+      }
+      
+      // Create all resume notifications in one insert
+      // entity_id is a UUID column and task IDs are not UUIDs, so it stays NULL;
+      // the task ID travels in metadata.taskId instead
+      if (notifications.length > 0) {
         try {
           await query(
             `INSERT INTO notifications (
               firm_id, user_id, type, title, message, priority,
-              entity_type, entity_id, action_url, metadata
-            ) VALUES ($1, $2, 'ai_agent', $3, $4, 'normal', 'background_task', $5, $6, $7)`,
+              entity_type, action_url, metadata
+            )
+            SELECT n.firm_id, n.user_id, 'ai_agent', 'Background Task Resumed', n.message, 'normal',
+                   'background_task', '/app/background-agent', n.metadata
+            FROM unnest($1::uuid[], $2::uuid[], $3::text[], $4::jsonb[])
+              AS n(firm_id, user_id, message, metadata)`,
             [
-              row.firm_id,
-              row.user_id,
-              'Background Task Resumed',
-              `Your task "${row.goal.substring(0, 50)}${row.goal.length > 50 ? '...' : ''}" is resuming after a server restart.`,
-              row.id,
-              '/app/background-agent',
-              JSON.stringify({
-                taskId: row.id,
-                resumedAt: new Date().toISOString(),
-                interruptedMinutes,
-                iteration: row.iterations || 0
-              })
+              notifications.map(n => n.firmId),
+              notifications.map(n => n.userId),
+              notifications.map(n => n.message),
+              notifications.map(n => n.metadata)
             ]
           );
         } catch (notifError) {
           // Non-fatal - notification creation failed
-          console.warn(`[AmplifierService] Failed to create resume notification for task ${row.id}:`, notifError.message);
+          console.warn(`[AmplifierService] Failed to create resume notifications:`, notifError.message);
         }
-
-        task.start({ resumeFromCheckpoint: true }).catch(err => {
-          console.error(`[AmplifierService] Resumed task ${row.id} failed:`, err);
-        });
-        
-        console.log(`[AmplifierService] Task ${row.id} resumed successfully`);
       }
       
-      console.log(`[AmplifierService] Finished resuming ${result.rows.length} task(s)`);
+      console.log(`[AmplifierService] Finished resuming ${notifications.length} task(s)`);
     } catch (error) {
       markPersistenceUnavailable(error);
       if (persistenceAvailable) {
@@ -5062,6 +5207,10 @@ class AmplifierService {
       activeTasks.delete(userId);
     });
     
+    task.on('handedOff', () => {
+      this.releaseHandedOffTask(task);
+    });
+    
     // Start the task (async)
     task.start().catch(err => {
       console.error(`[AmplifierService] Task ${taskId} failed:`, err);
@@ -5137,6 +5286,12 @@ class AmplifierService {
       const row = result.rows[0];
       
       if (!this.tasks.has(row.id)) {
+        const claimed = (await claimStoredTasks([row.id])).has(row.id);
+        if (!claimed || this.tasks.has(row.id)) {
+          // Another instance owns it, or another path resumed it while we claimed
+          return this.tasks.get(row.id)?.getStatus() || this.getTask(row.id);
+        }
+        
         const task = new BackgroundTask(row.id, row.user_id, row.firm_id, row.goal, row.options || {});
         task.progress = row.progress || task.progress;
         task.result = row.result || null;
@@ -5153,6 +5308,7 @@ class AmplifierService {
         task.on('complete', () => activeTasks.delete(task.userId));
         task.on('error', () => activeTasks.delete(task.userId));
         task.on('cancelled', () => activeTasks.delete(task.userId));
+        task.on('handedOff', () => this.releaseHandedOffTask(task));
 
         task.start({ resumeFromCheckpoint: true }).catch(err => {
           console.error(`[AmplifierService] On-demand resume failed for ${task.id}:`, err);
@@ -5532,6 +5688,61 @@ class AmplifierService {
       }
     }
   }
+
+  /**
+   * Forget a task whose lease another instance has taken over, so status
+   * reads here fall through to storage instead of this stopped copy
+   */
+  releaseHandedOffTask(task) {
+    if (this.tasks.get(task.id) === task) {
+      this.tasks.delete(task.id);
+    }
+    if (activeTasks.get(task.userId) === task.id) {
+      activeTasks.delete(task.userId);
+    }
+  }
+
+  /**
+   * Extend the leases on every live task this instance owns
+   * One statement per interval keeps other instances from claiming them
+   */
+  async renewTaskLeases() {
+    if (!persistenceAvailable || this.tasks.size === 0) return;
+    try {
+      await query(
+        `UPDATE ai_background_tasks
+         SET lease_expires_at = NOW() + make_interval(secs => $2)
+         WHERE claimed_by = $1 AND status IN ('running', 'pending')`,
+        [INSTANCE_ID, TASK_LEASE_MS / 1000]
+      );
+    } catch (error) {
+      markPersistenceUnavailable(error);
+      if (persistenceAvailable) {
+        console.error('[AmplifierService] Failed to renew task leases:', error.message);
+      }
+    }
+  }
+
+  /**
+   * Give up ownership of this instance's tasks so the next instance to start
+   * can resume them straight away instead of waiting for the leases to lapse
+   */
+  async releaseTaskLeases() {
+    if (!persistenceAvailable) return;
+    try {
+      await query(
+        `UPDATE ai_background_tasks
+         SET claimed_by = NULL, lease_expires_at = NULL
+         WHERE claimed_by = $1`,
+        [INSTANCE_ID]
+      );
+    } catch (error) {
+      markPersistenceUnavailable(error);
+      if (persistenceAvailable) {
+        console.error('[AmplifierService] Failed to release task leases:', error.message);
+      }
+    }
+  }
 }
 
 // Singleton instance
@@ -5542,12 +5753,17 @@ setInterval(() => {
   amplifierService.cleanup();
 }, 60 * 60 * 1000); // Every hour
 
+// Keep this instance's task leases alive
+setInterval(() => {
+  amplifierService.renewTaskLeases();
+}, TASK_LEASE_RENEW_MS);
+
 // Graceful shutdown handler - save all running task checkpoints
 async function gracefulShutdown(signal) {
   console.log(`[AmplifierService] Received ${signal}, saving task checkpoints...`);
   
   const runningTasks = Array.from(amplifierService.tasks.values()).filter(
-    task => task.status === TaskStatus.RUNNING
+    task => task.status === TaskStatus.RUNNING && !task.cancelled
   );
   
   if (runningTasks.length === 0) {
@@ -5573,12 +5789,40 @@ async function gracefulShutdown(signal) {
     })
   );
   
+  // Hand the tasks back so whichever instance starts next resumes them at once
+  await amplifierService.releaseTaskLeases();
+  
   console.log('[AmplifierService] All checkpoints saved');
 }
 
 // Register shutdown handlers
-process.on('SIGTERM', () => gracefulShutdown('SIGTERM'));
-process.on('SIGINT', () => gracefulShutdown('SIGINT'));
+// The first signal saves checkpoints (for at most SHUTDOWN_TIMEOUT_MS, since a
+// hung query must not keep the process alive); afterwards the signal is
+// re-raised without our listeners so the process exits the way it would have
+// if no handler had been registered. A second signal exits immediately.
+const SHUTDOWN_TIMEOUT_MS = 15000;
+let shutdownInProgress = null;
+
+function handleShutdownSignal(signal) {
+  if (shutdownInProgress) {
+    console.warn(`[AmplifierService] Received ${signal} again, exiting without waiting for checkpoints`);
+    process.exit(128 + os.constants.signals[signal]);
+  }
+  const timeout = new Promise(resolve => {
+    setTimeout(() => {
+      console.warn(`[AmplifierService] Checkpoints not saved within ${SHUTDOWN_TIMEOUT_MS}ms, exiting anyway`);
+      resolve();
+    }, SHUTDOWN_TIMEOUT_MS).unref();
+  });
+  shutdownInProgress = Promise.race([gracefulShutdown(signal), timeout]).finally(() => {
+    process.removeListener('SIGTERM', handleShutdownSignal);
+    process.removeListener('SIGINT', handleShutdownSignal);
+    process.kill(process.pid, signal);
+  });
+}
+
+process.on('SIGTERM', handleShutdownSignal);
+process.on('SIGINT', handleShutdownSignal);
 
 export default amplifierService;
 export { AmplifierService, BackgroundTask, TaskStatus };
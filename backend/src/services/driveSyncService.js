@@ -256,7 +256,22 @@ class DriveSyncJob extends EventEmitter {
     const fs = await import('fs/promises');
     const localPath = doc.path || path.join(process.cwd(), 'uploads', `doc-${doc.id}`);
     
-    await fs.writeFile(localPath, buffer);
+    // Write beside the target, fsync, and rename over it, so a download served
+    // while the sync is running (or the file after a crash) is never half-written
+    const tempPath = `${localPath}.${process.pid}.tmp`;
+    try {
+      const handle = await fs.open(tempPath, 'w');
+      try {
+        await handle.writeFile(buffer);
+        await handle.sync();
+      } finally {
+        await handle.close();
+      }
+      await fs.rename(tempPath, localPath);
+    } catch (error) {
+      await fs.rm(tempPath, { force: true }).catch(() => {});
+      throw error;
+    }
 
     // Update document record
     const checksum = crypto.createHash('md5').update(buffer).digest('hex');
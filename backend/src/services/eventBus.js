@@ -65,6 +65,10 @@ export function emitEvent(firmId, userId, eventType, data = {}) {
   const firmConnections = connections.get(firmId);
   if (!firmConnections) return;
 
+  // Nothing to serialize if the target user has no open connection
+  const userConns = userId ? firmConnections.get(userId) : null;
+  if (userId && !userConns) return;
+
   const event = JSON.stringify({
     type: eventType,
     data,
@@ -75,11 +79,8 @@ export function emitEvent(firmId, userId, eventType, data = {}) {
 
   if (userId) {
     // Send to specific user only
-    const userConns = firmConnections.get(userId);
-    if (userConns) {
-      for (const res of userConns) {
-        try { res.write(ssePayload); } catch (e) { /* connection closed */ }
-      }
+    for (const res of userConns) {
+      try { res.write(ssePayload); } catch (e) { /* connection closed */ }
     }
   } else {
     // Broadcast to all users in the firm
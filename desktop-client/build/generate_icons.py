@@ -3,10 +3,15 @@ Generate Apex Drive app icons for Windows (.ico) and Mac (.icns via PNG).
 Creates a professional-looking drive icon with the Apex "A" branding.
 """
 from PIL import Image, ImageDraw, ImageFont
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import struct
 import io
 import os
 
+# Every size is downscaled from one render at this size
+MASTER_SIZE = 512
+
 def create_icon_image(size):
     """Create an Apex Drive icon at the given size."""
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
@@ -63,18 +68,32 @@ def create_icon_image(size):
     
     return img
 
+@lru_cache(maxsize=None)
+def get_master_icon():
+    """Render the icon once at MASTER_SIZE."""
+    return create_icon_image(MASTER_SIZE)
+
+def get_icon_image(size):
+    """Get the icon at the given size, downscaled from the master render."""
+    master = get_master_icon()
+    if size == MASTER_SIZE:
+        return master
+    return master.resize((size, size), Image.LANCZOS)
+
 def create_ico(output_path):
     """Create a Windows .ico file with multiple sizes."""
     sizes = [16, 24, 32, 48, 64, 128, 256]
     images = []
     
     for s in sizes:
-        img = create_icon_image(s)
+        img = get_icon_image(s)
         images.append(img)
     
     # Save as ICO
-    # The largest image is saved first, then ico format handles the rest
-    images[-1].save(output_path, format='ICO', sizes=[(s, s) for s in sizes])
+    # The largest image is saved first; passing the smaller renders along lets
+    # the ico writer use them as-is instead of resampling the largest again
+    images[-1].save(output_path, format='ICO', sizes=[(s, s) for s in sizes],
+                    append_images=images[:-1])
     print(f"Created Windows icon: {output_path}")
 
 def create_png_set(output_dir):
@@ -91,11 +110,18 @@ def create_png_set(output_dir):
     
     os.makedirs(output_dir, exist_ok=True)
     
-    for filename, size in sizes.items():
-        img = create_icon_image(size)
+    def save_png(filename, size):
         path = os.path.join(output_dir, filename)
-        img.save(path, format='PNG')
-        print(f"Created PNG: {path} ({size}x{size})")
+        get_icon_image(size).save(path, format='PNG')
+        return path
+    
+    # Pillow releases the GIL while resizing and encoding, so threads are
+    # enough to run the sizes in parallel and they all share the master render
+    get_master_icon()
+    with ThreadPoolExecutor() as executor:
+        paths = executor.map(save_png, sizes.keys(), sizes.values())
+        for path, size in zip(paths, sizes.values()):
+            print(f"Created PNG: {path} ({size}x{size})")
     
     # Also save a 512x512 as the main icon.png in build/
     return os.path.join(output_dir, 'icon.png')
@@ -357,7 +357,7 @@ export class VirtualDrive extends EventEmitter {
           // Download file content - pass Azure path for direct Azure files
           try {
             const content = await this.apiClient.downloadFile(file.id, file.azurePath);
-            await fs.writeFile(filePath, content);
+            await this.writeFileAtomic(filePath, content);
             log.info(`Downloaded: ${file.name} (${content.length} bytes)`);
           } catch (downloadError) {
             log.error(`Failed to download ${file.name}:`, downloadError);
@@ -370,7 +370,7 @@ export class VirtualDrive extends EventEmitter {
         const metaDir = path.join(parentPath, '.apex-files');
         await fs.mkdir(metaDir, { recursive: true });
         const metaPath = path.join(metaDir, `${this.sanitizeFolderName(file.name)}.json`);
-        await fs.writeFile(metaPath, JSON.stringify({
+        await this.writeFileAtomic(metaPath, JSON.stringify({
           id: file.id,
           matterId,
           azurePath: file.azurePath,
@@ -496,6 +496,29 @@ export class VirtualDrive extends EventEmitter {
       .substring(0, 200); // Max reasonable length
   }
 
+  /**
+   * Write a file via a hidden temp sibling that is fsynced and renamed over
+   * the target, so the file watcher and metadata readers never see a
+   * partially written file
+   */
+  private async writeFileAtomic(filePath: string, data: string | Buffer): Promise<void> {
+    const tempPath = path.join(path.dirname(filePath), `.${path.basename(filePath)}.${process.pid}.tmp`);
+    try {
+      const handle = await fs.open(tempPath, 'w');
+      try {
+        await handle.writeFile(data);
+        await handle.sync();
+      } finally {
+        await handle.close();
+      }
+      await fs.rename(tempPath, filePath);
+    } catch (error) {
+      // Best-effort cleanup; a failed rm must not mask the original error
+      await fs.rm(tempPath, { force: true }).catch(() => {});
+      throw error;
+    }
+  }
+
   /**
    * Start periodic sync
    */
@@ -658,7 +681,7 @@ export class VirtualDrive extends EventEmitter {
             
             // Save metadata for future updates
             await fs.mkdir(metaDir, { recursive: true });
-            await fs.writeFile(metaPath, JSON.stringify({
+            await this.writeFileAtomic(metaPath, JSON.stringify({
               id: result.documentId,
               matterId,
               azurePath: result.azurePath,
@@ -683,7 +706,7 @@ export class VirtualDrive extends EventEmitter {
               await this.apiClient.uploadFile(result.documentId, content);
               
               await fs.mkdir(metaDir, { recursive: true });
-              await fs.writeFile(metaPath, JSON.stringify({
+              await this.writeFileAtomic(metaPath, JSON.stringify({
                 id: result.documentId,
                 size: content.length,
                 updatedAt: new Date().toISOString(),
@@ -33,6 +33,9 @@ interface ActiveTask {
   isComplete: boolean
 }
 
+const POLL_INTERVAL_MS = 10000
+const MAX_IDLE_POLL_INTERVAL_MS = 60000
+
 export function AgentStatusWidget() {
   const navigate = useNavigate()
   const [activeTasks, setActiveTasks] = useState<ActiveTask[]>([])
@@ -40,8 +43,15 @@ export function AgentStatusWidget() {
   const [isHidden, setIsHidden] = useState(true)
   const eventSourcesRef = useRef<Map<string, EventSource>>(new Map())
   
-  // Poll for active tasks
-  const checkActiveTasks = useCallback(async () => {
+  // Read tasks through a ref so progress events don't recreate the poll callback
+  // (which would tear down the poll loop and every open stream)
+  const activeTasksRef = useRef<ActiveTask[]>([])
+  useEffect(() => {
+    activeTasksRef.current = activeTasks
+  }, [activeTasks])
+  
+  // Poll for active tasks; resolves true while any task is running
+  const checkActiveTasks = useCallback(async (): Promise<boolean> => {
     try {
       const apiUrl = import.meta.env.VITE_API_URL || 'http://localhost:3001/api'
       const token = localStorage.getItem('token')
@@ -52,7 +62,7 @@ export function AgentStatusWidget() {
         }
       })
       
-      if (!response.ok) return
+      if (!response.ok) return false
       
       const data = await response.json()
       const tasks = data.tasks || []
@@ -71,14 +81,19 @@ export function AgentStatusWidget() {
             connectToTask(task.id)
           }
         }
-      } else if (activeTasks.length === 0 || activeTasks.every(t => t.isComplete)) {
+        return true
+      }
+      
+      const currentTasks = activeTasksRef.current
+      if (currentTasks.length === 0 || currentTasks.every(t => t.isComplete)) {
         // Hide after a delay when all tasks complete
         setTimeout(() => setIsHidden(true), 5000)
       }
     } catch (e) {
       console.error('[AgentWidget] Error checking tasks:', e)
     }
-  }, [activeTasks])
+    return false
+  }, [])
   
   // Connect to a task's SSE stream
   const connectToTask = (taskId: string) => {
@@ -134,13 +149,36 @@ export function AgentStatusWidget() {
     }
   }
   
-  // Poll every 10 seconds
+  // Poll every 10 seconds while a task is running; while idle, back off
+  // (doubling up to once a minute) and wake immediately when a task starts
   useEffect(() => {
-    checkActiveTasks()
-    const interval = setInterval(checkActiveTasks, 10000)
+    let delay = POLL_INTERVAL_MS
+    let timer: ReturnType<typeof setTimeout> | undefined
+    let cancelled = false
+    let generation = 0
+    
+    const poll = async () => {
+      // A newer poll (e.g. from a task-start wake) supersedes this one
+      const current = ++generation
+      const hasRunning = await checkActiveTasks()
+      if (cancelled || current !== generation) return
+      delay = hasRunning ? POLL_INTERVAL_MS : Math.min(delay * 2, MAX_IDLE_POLL_INTERVAL_MS)
+      timer = setTimeout(poll, delay)
+    }
+    
+    const handleTaskStarted = () => {
+      clearTimeout(timer)
+      delay = POLL_INTERVAL_MS
+      poll()
+    }
+    
+    poll()
+    window.addEventListener('backgroundTaskStarted', handleTaskStarted)
     
     return () => {
-      clearInterval(interval)
+      cancelled = true
+      clearTimeout(timer)
+      window.removeEventListener('backgroundTaskStarted', handleTaskStarted)
       // Clean up all connections
       eventSourcesRef.current.forEach(es => es.close())
       eventSourcesRef.current.clear()
@@ -289,9 +289,19 @@ export function BackgroundTaskBar() {
     // Check immediately
     checkActiveTask()
 
-    // Then poll every 2 seconds
-    const intervalId = setInterval(checkActiveTask, 2000)
-    return () => clearInterval(intervalId)
+    // Then poll every 2 seconds while the tab is visible; a hidden tab
+    // doesn't poll and catches up as soon as it is shown again
+    const intervalId = setInterval(() => {
+      if (!document.hidden) checkActiveTask()
+    }, 2000)
+    const handleVisibilityChange = () => {
+      if (!document.hidden) checkActiveTask()
+    }
+    document.addEventListener('visibilitychange', handleVisibilityChange)
+    return () => {
+      clearInterval(intervalId)
+      document.removeEventListener('visibilitychange', handleVisibilityChange)
+    }
   }, [polling, isComplete, checkActiveTask])
 
   // NOTE: Only auto-check for Amplifier background tasks on mount
@@ -74,8 +74,22 @@ const ICON_MAP: Record<string, React.ReactNode> = {
   'circle': <Activity size={14} />,
 }
 
+const COLOR_CLASS_MAP: Record<string, string> = {
+  'gray': styles.eventGray,
+  'blue': styles.eventBlue,
+  'green': styles.eventGreen,
+  'red': styles.eventRed,
+  'orange': styles.eventOrange,
+  'purple': styles.eventPurple,
+  'indigo': styles.eventIndigo,
+}
+
 function getEventIcon(icon: string | undefined): React.ReactNode {
-  return ICON_MAP[icon || 'circle'] || <Activity size={14} />
+  return ICON_MAP[icon || 'circle'] || ICON_MAP['circle']
+}
+
+function getEventColorClass(color: string | undefined): string {
+  return (color && COLOR_CLASS_MAP[color]) || styles.eventDefault
 }
 
 function formatTimestamp(timestamp: string): string {
@@ -199,19 +213,6 @@ export function AgentConsolePage() {
     return true
   })
   
-  const getEventColorClass = (color: string | undefined): string => {
-    switch (color) {
-      case 'gray': return styles.eventGray
-      case 'blue': return styles.eventBlue
-      case 'green': return styles.eventGreen
-      case 'red': return styles.eventRed
-      case 'orange': return styles.eventOrange
-      case 'purple': return styles.eventPurple
-      case 'indigo': return styles.eventIndigo
-      default: return styles.eventDefault
-    }
-  }
-  
   const isComplete = progress?.status === 'completed' || progress?.status === 'failed'
   const isFailed = progress?.status === 'failed'
   
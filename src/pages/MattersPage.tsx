@@ -296,8 +296,13 @@ export function MattersPage() {
     }
   }
 
+  // Rows look up client and attorney names by id; index them once per
+  // list change instead of scanning the arrays for every cell
+  const clientNameById = useMemo(() => new Map(clients.map(c => [c.id, c.name])), [clients])
+  const attorneyNameById = useMemo(() => new Map(attorneys.map(a => [a.id, a.name])), [attorneys])
+
   const getClientName = (clientId: string) => {
-    return clients.find(c => c.id === clientId)?.name || 'Unknown Client'
+    return clientNameById.get(clientId) || 'Unknown Client'
   }
 
   return (
@@ -479,7 +484,7 @@ export function MattersPage() {
                           <td key={col.id}>
                             {matter.responsibleAttorney ? (
                               <span className={styles.attorneyName}>
-                                {attorneys.find(a => a.id === matter.responsibleAttorney)?.name || 'Assigned'}
+                                {attorneyNameById.get(matter.responsibleAttorney) || 'Assigned'}
                               </span>
                             ) : (
                               <span className={styles.unassigned}>Unassigned</span>
@@ -565,7 +570,7 @@ export function MattersPage() {
                           <td key={col.id}>
                             {matter.originatingAttorney ? (
                               <span className={styles.attorneyName}>
-                                {attorneys.find(a => a.id === matter.originatingAttorney)?.name || 'Assigned'}
+                                {attorneyNameById.get(matter.originatingAttorney) || 'Assigned'}
                               </span>
                             ) : (
                               <span className={styles.unassigned}>—</span>